@@ -7,50 +7,16 @@ This script tests the GUI without requiring admin privileges
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+from mainstall import apply_dark_theme
+
 def test_gui():
     """Test the GUI components without admin privileges."""
     root = tk.Tk()
     root.title("Mainstall - GUI Test")
     root.geometry("600x400")
     
-    # Test dark theme with high contrast
-    style = ttk.Style()
-    style.theme_use('clam')
-    
-    bg_color = "#1e1e1e"  # Dark background
-    fg_color = "#ffffff"  # Bright white text for maximum readability
-    button_bg = "#6a6a6a"  # Much lighter button background for contrast
-    button_fg = "#000000"  # Black button text for contrast
-    selected_bg = "#0078d4"  # Blue for selected items
-    tab_bg = "#6a6a6a"  # Same light gray as buttons for consistency
-    tab_fg = "#000000"  # Black tab text for contrast (same as buttons)
-    
-    style.configure('TFrame', background=bg_color)
-    style.configure('TNotebook', background=bg_color)
-    style.configure('TNotebook.Tab', 
-                   background=tab_bg, 
-                   foreground=tab_fg,
-                   padding=[20, 10],
-                   font=('Segoe UI', 10, 'bold'))  # Bold tab text
-    style.map('TNotebook.Tab',
-             background=[('selected', selected_bg), ('active', button_bg)])
-    style.configure('TButton', 
-                   background=button_bg, 
-                   foreground=button_fg,
-                   padding=[15, 8],
-                   font=('Segoe UI', 10, 'bold'))  # Bold button text
-    style.map('TButton',
-             background=[('active', selected_bg), ('pressed', selected_bg)])
-    style.configure('TLabel', 
-                   background=bg_color, 
-                   foreground=fg_color,
-                   font=('Segoe UI', 11))  # Larger, clearer label text
-    style.configure('TScrollbar', 
-                   background=button_bg,
-                   troughcolor=bg_color,
-                   width=12)
-    
-    root.configure(bg=bg_color)
+    # Test dark theme with high contrast, using the application's own styles
+    apply_dark_theme(root)
     
     # Create main frame
     main_frame = ttk.Frame(root)